@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import google.auth
 from fastapi import FastAPI
@@ -34,9 +37,6 @@ allow_origins = (
 )
 
 bucket_name = f"gs://{project_id}-my-fullstack-agent-logs-data"
-create_bucket_if_not_exists(
-    bucket_name=bucket_name, project=project_id, location="us-central1"
-)
 
 provider = TracerProvider()
 processor = export.BatchSpanProcessor(CloudTraceLoggingSpanExporter())
@@ -48,24 +48,39 @@ AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Use environment variable for agent name, default to project name
 agent_name = os.environ.get("AGENT_ENGINE_SESSION_NAME", "my-fullstack-agent")
 
-# Check if an agent with this name already exists
-existing_agents = list(agent_engines.list(filter=f"display_name={agent_name}"))
+# Use the first agent with this name, without paging through the rest
+agent_engine = next(iter(agent_engines.list(filter=f"display_name={agent_name}")), None)
 
-if existing_agents:
-    # Use the existing agent
-    agent_engine = existing_agents[0]
-else:
+if agent_engine is None:
     # Create a new agent if none exists
     agent_engine = agent_engines.create(display_name=agent_name)
 
 session_service_uri = f"agentengine://{agent_engine.resource_name}"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the artifact bucket on startup instead of at import time.
+
+    Args:
+        app: The FastAPI application being started
+    """
+    await asyncio.to_thread(
+        create_bucket_if_not_exists,
+        bucket_name=bucket_name,
+        project=project_id,
+        location="us-central1",
+    )
+    yield
+
+
 app: FastAPI = get_fast_api_app(
     agents_dir=AGENT_DIR,
     web=True,
     artifact_service_uri=bucket_name,
     allow_origins=allow_origins,
     session_service_uri=session_service_uri,
+    lifespan=lifespan,
 )
 app.title = "my-fullstack-agent"
 app.description = "API for interacting with the Agent my-fullstack-agent"
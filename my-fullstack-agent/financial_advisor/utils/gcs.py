@@ -32,11 +32,11 @@ def create_bucket_if_not_exists(bucket_name: str, project: str, location: str) -
         bucket_name = bucket_name[5:]
     try:
         storage_client.get_bucket(bucket_name)
-        logging.info(f"Bucket {bucket_name} already exists")
+        logging.info("Bucket %s already exists", bucket_name)
     except exceptions.NotFound:
         bucket = storage_client.create_bucket(
             bucket_name,
             location=location,
             project=project,
         )
-        logging.info(f"Created bucket {bucket.name} in {bucket.location}")
+        logging.info("Created bucket %s in %s", bucket.name, bucket.location)
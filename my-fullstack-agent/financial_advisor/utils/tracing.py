@@ -61,6 +61,8 @@ class CloudTraceLoggingSpanExporter(CloudTraceSpanExporter):
             bucket_name or f"{self.project_id}-my-fullstack-agent-logs-data"
         )
         self.bucket = self.storage_client.bucket(self.bucket_name)
+        # Only a positive lookup is cached, so a bucket created later is still found
+        self._bucket_exists = False
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """
@@ -73,7 +75,7 @@ class CloudTraceLoggingSpanExporter(CloudTraceSpanExporter):
             span_context = span.get_span_context()
             trace_id = format(span_context.trace_id, "x")
             span_id = format(span_context.span_id, "x")
-            span_dict = json.loads(span.to_json())
+            span_dict = json.loads(span.to_json(indent=None))
 
             span_dict["trace"] = f"projects/{self.project_id}/traces/{trace_id}"
             span_dict["span_id"] = span_id
@@ -105,12 +107,14 @@ class CloudTraceLoggingSpanExporter(CloudTraceSpanExporter):
         :param span_id: The ID of the span
         :return: The  GCS URI of the stored content
         """
-        if not self.storage_client.bucket(self.bucket_name).exists():
-            logging.warning(
-                f"Bucket {self.bucket_name} not found. "
-                "Unable to store span attributes in GCS."
-            )
-            return "GCS bucket not found"
+        if not self._bucket_exists:
+            if not self.bucket.exists():
+                logging.warning(
+                    "Bucket %s not found. Unable to store span attributes in GCS.",
+                    self.bucket_name,
+                )
+                return "GCS bucket not found"
+            self._bucket_exists = True
 
         blob_name = f"spans/{span_id}.json"
         blob = self.bucket.blob(blob_name)
@@ -129,13 +133,14 @@ class CloudTraceLoggingSpanExporter(CloudTraceSpanExporter):
         :return: The updated span dictionary
         """
         attributes = span_dict["attributes"]
-        if len(json.dumps(attributes).encode()) > 255 * 1024:  # 250 KB
+        # Serialize once and reuse it for both the size check and the upload
+        attributes_json = json.dumps(attributes)
+        if len(attributes_json.encode()) > 255 * 1024:  # 250 KB
             # Separate large payload from other attributes
-            attributes_payload = dict(attributes.items())
             attributes_retain = dict(attributes.items())
 
             # Store large payload in GCS
-            gcs_uri = self.store_in_gcs(json.dumps(attributes_payload), span_id)
+            gcs_uri = self.store_in_gcs(attributes_json, span_id)
             attributes_retain["uri_payload"] = gcs_uri
             attributes_retain["url_payload"] = (
                 f"https://storage.mtls.cloud.google.com/"
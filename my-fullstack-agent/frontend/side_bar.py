@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# ruff: noqa: RUF015
 import json
 import os
 import uuid
@@ -131,7 +130,7 @@ class SideBar:
                         self.st.session_state["session_id"]
                     )
                     if len(self.st.session_state.user_chats) > 0:
-                        chat_id = list(self.st.session_state.user_chats.keys())[0]
+                        chat_id = next(iter(self.st.session_state.user_chats))
                         self.st.session_state["session_id"] = chat_id
                         self.st.session_state.session_db.get_session(
                             session_id=self.st.session_state["session_id"],
@@ -20,6 +20,12 @@ from langchain_core.chat_history import BaseChatMessageHistory
 
 from frontend.utils.title_summary import chain_title
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 class LocalChatMessageHistory(BaseChatMessageHistory):
     """Manages local storage and retrieval of chat message history."""
@@ -50,7 +56,7 @@ class LocalChatMessageHistory(BaseChatMessageHistory):
             if filename.endswith(".yaml"):
                 file_path = os.path.join(self.user_dir, filename)
                 with open(file_path, encoding="utf-8") as f:
-                    conversation = yaml.safe_load(f)
+                    conversation = yaml.load(f, Loader=SafeLoader)
                     if not isinstance(conversation, list) or len(conversation) > 1:
                         raise ValueError(
                             f"""Invalid format in {file_path}.
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+import functools
 from typing import Any
 from urllib.parse import quote
 
@@ -35,8 +36,9 @@ def format_content(content: str | list[dict[str, Any]]) -> str:
         return content
     if len(content) == 1 and content[0]["type"] == "text":
         return content[0]["text"]
-    markdown = """Media:
-"""
+    # Collect the pieces and join once: inline images are base64 data URLs,
+    # so repeated concatenation would copy megabytes per part.
+    chunks = ["Media:\n"]
     text = ""
     for part in content:
         if part["type"] == "text":
@@ -45,42 +47,32 @@ def format_content(content: str | list[dict[str, Any]]) -> str:
         if part["type"] == "image_url":
             image_url = part["image_url"]["url"]
             image_markdown = f'<img src="{image_url}" width="100">'
-            markdown = (
-                markdown
-                + f"""
-- {image_markdown}
-"""
-            )
+            chunks.append(f"\n- {image_markdown}\n")
         if part["type"] == "media":
             # Local other media
             if "data" in part:
-                markdown = markdown + f"- Local media: {part['file_name']}\n"
+                chunks.append(f"- Local media: {part['file_name']}\n")
             # From GCS:
             if "file_uri" in part:
                 # GCS images
                 if "image" in part["mime_type"]:
                     image_url = gs_uri_to_https_url(part["file_uri"])
                     image_markdown = f'<img src="{image_url}" width="100">'
-                    markdown = (
-                        markdown
-                        + f"""
-- {image_markdown}
-"""
-                    )
+                    chunks.append(f"\n- {image_markdown}\n")
                 # GCS other media
                 else:
                     image_url = gs_uri_to_https_url(part["file_uri"])
-                    markdown = (
-                        markdown + f"- Remote media: "
-                        f"[{part['file_uri']}]({image_url})\n"
+                    chunks.append(
+                        f"- Remote media: [{part['file_uri']}]({image_url})\n"
                     )
-    markdown = (
-        markdown
-        + f"""
+    chunks.append(f"\n\n{text}")
+    return "".join(chunks)
+
 
-{text}"""
-    )
-    return markdown
+@functools.cache
+def get_storage_client() -> storage.Client:
+    """Get a shared storage client so GCS calls reuse one connection pool."""
+    return storage.Client()
 
 
 def get_gcs_blob_mime_type(gcs_uri: str) -> str | None:
@@ -93,10 +85,10 @@ def get_gcs_blob_mime_type(gcs_uri: str) -> str | None:
         str: The MIME type of the blob (e.g., "image/jpeg", "text/plain") if found,
              or None if the blob does not exist or an error occurs.
     """
-    storage_client = storage.Client()
+    storage_client = get_storage_client()
 
     try:
-        bucket_name, object_name = gcs_uri.replace("gs://", "").split("/", 1)
+        bucket_name, object_name = gcs_uri.removeprefix("gs://").split("/", 1)
 
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(object_name)
@@ -166,7 +158,7 @@ def upload_bytes_to_gcs(
     Raises:
         GoogleCloudError: If there's an issue with the GCS operation.
     """
-    storage_client = storage.Client()
+    storage_client = get_storage_client()
     bucket = storage_client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
     blob.upload_from_string(data=file_bytes, content_type=content_type)
@@ -201,7 +193,7 @@ def gs_uri_to_https_url(gs_uri: str) -> str:
 
 def upload_files_to_gcs(st: Any, bucket_name: str, files_to_upload: list[Any]) -> None:
     """Upload multiple files to Google Cloud Storage and store URIs in session state."""
-    bucket_name = bucket_name.replace("gs://", "")
+    bucket_name = bucket_name.removeprefix("gs://")
     uploaded_uris = []
     for file in files_to_upload:
         if file:
@@ -67,6 +67,17 @@ def get_remote_url_config(url: str, authenticate_request: bool) -> dict[str, Any
     }
 
 
+def get_http_session() -> requests.Session:
+    """Get this browser session's HTTP session so its calls reuse connections.
+
+    Kept in session state rather than st.cache_resource so cookies and the
+    connection pool are never shared between users' script threads.
+    """
+    if "http_session" not in st.session_state:
+        st.session_state.http_session = requests.Session()
+    return st.session_state.http_session
+
+
 @st.cache_resource()
 def get_local_agent(agent_callable_path: str) -> Any:
     """Get cached local agent instance."""
@@ -101,6 +112,7 @@ class Client:
             self.authenticate_request = remote_config["authenticate_request"]
             self.creds = remote_config["creds"]
             self.id_token = remote_config["id_token"]
+            self.session = get_http_session()
             self.agent = None
         elif remote_agent_engine_id:
             self.agent = get_remote_agent(remote_agent_engine_id)
@@ -139,7 +151,7 @@ class Client:
             }
             if self.authenticate_request:
                 headers["Authorization"] = f"Bearer {self.id_token}"
-            requests.post(
+            self.session.post(
                 url, data=json.dumps(feedback_dict), headers=headers, timeout=10
             )
         elif self.agent is not None:
@@ -158,13 +170,13 @@ class Client:
             }
             if self.authenticate_request:
                 headers["Authorization"] = f"Bearer {self.id_token}"
-            with requests.post(
+            with self.session.post(
                 self.url, json=data, headers=headers, stream=True, timeout=60
             ) as response:
                 for line in response.iter_lines():
                     if line:
                         try:
-                            event = json.loads(line.decode("utf-8"))
+                            event = json.loads(line)
                             yield event
                         except json.JSONDecodeError:
                             print(f"Failed to parse event: {line.decode('utf-8')}")
@@ -229,43 +241,41 @@ class EventProcessor:
         )
         # Each event is a tuple message, metadata. https://langchain-ai.github.io/langgraph/how-tos/streaming/#messages
         for message, _ in stream:
-            if isinstance(message, dict):
-                if message.get("type") == "constructor":
-                    message = message["kwargs"]
-
-                    # Handle tool calls
-                    if message.get("tool_calls"):
-                        tool_calls = message["tool_calls"]
-                        ai_message = AIMessage(content="", tool_calls=tool_calls)
-                        self.tool_calls.append(ai_message.model_dump())
-                        for tool_call in tool_calls:
-                            msg = f"\n\nCalling tool: `{tool_call['name']}` with args: `{tool_call['args']}`"
-                            self.stream_handler.new_status(msg)
-
-                    # Handle tool responses
-                    elif message.get("tool_call_id"):
-                        content = message["content"]
-                        tool_call_id = message["tool_call_id"]
-                        tool_message = ToolMessage(
-                            content=content, type="tool", tool_call_id=tool_call_id
-                        ).model_dump()
-                        self.tool_calls.append(tool_message)
-                        msg = f"\n\nTool response: `{content}`"
-                        self.stream_handler.new_status(msg)
-
-                    # Handle incremental AI response chunks
-                    # These are partial content pieces that need to be accumulated
-                    elif (
-                        message.get("content")
-                        and message.get("type") == "AIMessageChunk"
-                    ):
-                        self.final_content += message.get("content")
-                        self.stream_handler.new_token(message.get("content"))
-
-                    # Handle complete AI responses
-                    # This is used when receiving a full message rather than chunks
-                    elif message.get("content") and message.get("type") == "ai":
-                        self.final_content = message.get("content")
+            if not isinstance(message, dict) or message.get("type") != "constructor":
+                continue
+            message = message["kwargs"]
+            content = message.get("content")
+            message_type = message.get("type")
+
+            # Handle tool calls
+            if message.get("tool_calls"):
+                tool_calls = message["tool_calls"]
+                ai_message = AIMessage(content="", tool_calls=tool_calls)
+                self.tool_calls.append(ai_message.model_dump())
+                for tool_call in tool_calls:
+                    msg = f"\n\nCalling tool: `{tool_call['name']}` with args: `{tool_call['args']}`"
+                    self.stream_handler.new_status(msg)
+
+            # Handle tool responses
+            elif message.get("tool_call_id"):
+                tool_call_id = message["tool_call_id"]
+                tool_message = ToolMessage(
+                    content=content, type="tool", tool_call_id=tool_call_id
+                ).model_dump()
+                self.tool_calls.append(tool_message)
+                msg = f"\n\nTool response: `{content}`"
+                self.stream_handler.new_status(msg)
+
+            # Handle incremental AI response chunks
+            # These are partial content pieces that need to be accumulated
+            elif content and message_type == "AIMessageChunk":
+                self.final_content += content
+                self.stream_handler.new_token(content)
+
+            # Handle complete AI responses
+            # This is used when receiving a full message rather than chunks
+            elif content and message_type == "ai":
+                self.final_content = content
 
         # Handle end of stream
         if self.final_content:
@@ -275,10 +285,9 @@ class EventProcessor:
                 additional_kwargs=self.additional_kwargs,
             ).model_dump()
             session = self.st.session_state["session_id"]
-            self.st.session_state.user_chats[session]["messages"] = (
-                self.st.session_state.user_chats[session]["messages"] + self.tool_calls
-            )
-            self.st.session_state.user_chats[session]["messages"].append(final_message)
+            messages = self.st.session_state.user_chats[session]["messages"]
+            messages.extend(self.tool_calls)
+            messages.append(final_message)
             self.st.session_state.run_id = self.current_run_id
 
 
@@ -92,7 +92,7 @@ def wait_for_server(timeout: int = 60, interval: int = 1) -> bool:
         except RequestException:
             pass
         time.sleep(interval)
-    logger.error(f"Server did not become ready within {timeout} seconds")
+    logger.error("Server did not become ready within %s seconds", timeout)
     return False
 
 
@@ -131,7 +131,7 @@ def test_chat_stream(server_fixture: subprocess.Popen[str]) -> None:
         timeout=60,
     )
     assert session_response.status_code == 200
-    logger.info(f"Session creation response: {session_response.json()}")
+    logger.info("Session creation response: %s", session_response.text)
     session_id = session_response.json()["id"]
 
     # Then send chat message
@@ -154,11 +154,9 @@ def test_chat_stream(server_fixture: subprocess.Popen[str]) -> None:
     events = []
     for line in response.iter_lines():
         if line:
-            # SSE format is "data: {json}"
-            line_str = line.decode("utf-8")
-            if line_str.startswith("data: "):
-                event_json = line_str[6:]  # Remove "data: " prefix
-                event = json.loads(event_json)
+            # SSE format is "data: {json}"; json.loads accepts the raw bytes
+            if line.startswith(b"data: "):
+                event = json.loads(line[6:])  # Remove "data: " prefix
                 events.append(event)
 
     assert events, "No events received from stream"
@@ -229,10 +227,10 @@ def cleanup_agent_engine_sessions() -> None:
         for agent_engine in existing_agents:
             try:
                 agent_engines.delete(resource_name=agent_engine.name)
-                logger.info(f"Cleaned up agent engine: {agent_engine.name}")
+                logger.info("Cleaned up agent engine: %s", agent_engine.name)
             except Exception as e:
                 logger.warning(
-                    f"Failed to cleanup agent engine {agent_engine.name}: {e}"
+                    "Failed to cleanup agent engine %s: %s", agent_engine.name, e
                 )
     except Exception as e:
-        logger.warning(f"Failed to cleanup agent engine sessions: {e}")
+        logger.warning("Failed to cleanup agent engine sessions: %s", e)
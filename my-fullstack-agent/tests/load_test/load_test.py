@@ -16,7 +16,6 @@ import os
 import time
 import uuid
 
-import requests
 from locust import HttpUser, between, task
 
 ENDPOINT = "/run_sse"
@@ -37,9 +36,10 @@ class ChatStreamUser(HttpUser):
         user_id = f"user_{uuid.uuid4()}"
         session_data = {"state": {"preferred_language": "English", "visit_count": 1}}
 
-        session_url = f"{self.client.base_url}/apps/financial_advisor/users/{user_id}/sessions"
-        session_response = requests.post(
-            session_url,
+        # Reuse the user's pooled HTTP session so the connection is kept alive
+        session_response = self.client.post(
+            f"/apps/financial_advisor/users/{user_id}/sessions",
+            name="/apps/financial_advisor/users/[user_id]/sessions",
             headers=headers,
             json=session_data,
             timeout=10,
@@ -71,13 +71,13 @@ class ChatStreamUser(HttpUser):
             params={"alt": "sse"},
         ) as response:
             if response.status_code == 200:
-                events = []
+                event_count = 0
                 for line in response.iter_lines():
                     if line:
-                        line_str = line.decode("utf-8")
-                        events.append(line_str)
+                        event_count += 1
 
-                        if "429 Too Many Requests" in line_str:
+                        # Scan the raw bytes; the line is never needed as text
+                        if b"429 Too Many Requests" in line:
                             self.environment.events.request.fire(
                                 request_type="POST",
                                 name=f"{ENDPOINT} rate_limited 429s",
@@ -92,7 +92,7 @@ class ChatStreamUser(HttpUser):
                     request_type="POST",
                     name=f"{ENDPOINT} end",
                     response_time=total_time * 1000,  # Convert to milliseconds
-                    response_length=len(events),
+                    response_length=event_count,
                     response=response,
                     context={},
                 )